@@ -60,4 +60,6 @@ async def storage_resources(
 ):
     """Exposes list of all storage resources with pagination and filtering."""
     storage_data = await orchestrator.get_resources(filters)
-    return storage_data
+    # The payload is already JSON-compatible; returning the response directly
+    # skips FastAPI's jsonable_encoder walk over every resource.
+    return JSONResponse(content=storage_data)
@@ -1,7 +1,9 @@
 from typing import Optional
 
 from pydantic import Field, HttpUrl, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings
+
+from waldur_cscs_hpc_storage.config.common import SECTION_SETTINGS_CONFIG
 
 
 class AuthConfig(BaseSettings):
@@ -20,12 +22,7 @@ class AuthConfig(BaseSettings):
         default=None, alias="CSCS_KEYCLOAK_CLIENT_SECRET"
     )
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        populate_by_name=True,
-        extra="ignore",
-    )
+    model_config = SECTION_SETTINGS_CONFIG
 
     @model_validator(mode="after")
     def validate_auth_requirements(self) -> "AuthConfig":
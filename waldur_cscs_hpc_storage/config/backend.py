@@ -1,5 +1,7 @@
 from pydantic import Field, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings
+
+from waldur_cscs_hpc_storage.config.common import SECTION_SETTINGS_CONFIG
 
 
 class BackendConfig(BaseSettings):
@@ -23,9 +25,4 @@ class BackendConfig(BaseSettings):
             raise ValueError(msg)
         return self
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        populate_by_name=True,
-        extra="ignore",
-    )
+    model_config = SECTION_SETTINGS_CONFIG
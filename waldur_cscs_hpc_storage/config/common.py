@@ -0,0 +1,28 @@
+"""Settings shared by the configuration section models."""
+
+import re
+
+from pydantic_settings import SettingsConfigDict
+
+# Every section reads its own aliased variables from the environment and .env,
+# since StorageProxyConfig builds them through default factories.
+SECTION_SETTINGS_CONFIG = SettingsConfigDict(
+    env_file=".env",
+    env_file_encoding="utf-8",
+    defer_build=True,
+    frozen=True,
+    populate_by_name=True,
+    extra="ignore",
+)
+
+PROXY_URL_SCHEMES = ("socks5://", "socks5h://", "http://", "https://")
+_PROXY_URL_RE = re.compile(r"(?:socks5h?|https?)://", re.IGNORECASE)
+
+
+def check_proxy_url(v: str | None) -> str | None:
+    """Validate that a proxy URL uses one of the supported schemes."""
+    if v and not _PROXY_URL_RE.match(v):
+        raise ValueError(
+            f"Proxy URL must start with one of: {', '.join(PROXY_URL_SCHEMES)}"
+        )
+    return v
@@ -1,7 +1,15 @@
 from typing import Optional
 
 from pydantic import Field, HttpUrl, field_validator, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings
+
+from waldur_cscs_hpc_storage.config.common import (
+    SECTION_SETTINGS_CONFIG,
+    check_proxy_url,
+)
+
+# Connection settings that must be set outside development mode
+_PROD_REQUIRED_FIELDS = ("api_url", "client_id", "client_secret")
 
 
 class HpcUserApiConfig(BaseSettings):
@@ -23,35 +31,19 @@ class HpcUserApiConfig(BaseSettings):
         alias="HPC_USER_DEVELOPMENT_MODE",
     )
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        populate_by_name=True,
-        extra="ignore",
-    )
+    model_config = SECTION_SETTINGS_CONFIG
 
     @field_validator("socks_proxy")
     @classmethod
     def validate_proxy_url(cls, v: Optional[str]) -> Optional[str]:
-        if v:
-            allowed_schemes = ("socks5://", "socks5h://", "http://", "https://")
-            if not v.lower().startswith(allowed_schemes):
-                raise ValueError(
-                    f"Proxy URL must start with one of: {', '.join(allowed_schemes)}"
-                )
-        return v
+        return check_proxy_url(v)
 
     @model_validator(mode="after")
     def validate_prod_requirements(self) -> "HpcUserApiConfig":
         if not self.development_mode:
-            missing = []
-            if not self.api_url:
-                missing.append("api_url")
-            if not self.client_id:
-                missing.append("client_id")
-            if not self.client_secret:
-                missing.append("client_secret")
-
+            missing = [
+                field for field in _PROD_REQUIRED_FIELDS if not getattr(self, field)
+            ]
             if missing:
                 raise ValueError(
                     f"Connection credentials ({', '.join(missing)}) are required "
@@ -30,6 +30,8 @@ class StorageProxyConfig(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
+        defer_build=True,
+        frozen=True,
         # We handle env vars manually via aliases on fields or nested models,
         # so we disable generic env prefixing to avoid pollution/confusion.
         env_nested_delimiter=None,
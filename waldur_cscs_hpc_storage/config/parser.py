@@ -11,6 +11,9 @@ from waldur_cscs_hpc_storage.sentry_config import initialize_sentry
 
 logger = logging.getLogger(__name__)
 
+_SENSITIVE_KEYS = frozenset({"access_token", "client_secret", "keycloak_client_secret"})
+_MASK = "********"
+
 
 def load_config() -> StorageProxyConfig:
     """Load and validate configuration.
@@ -42,9 +45,10 @@ def load_config() -> StorageProxyConfig:
     if config.sentry and config.sentry.dsn:
         initialize_sentry(config.sentry)
 
-    # Log merged configuration
-    safe_config = mask_sensitive_data(config.model_dump())
-    logger.info("Merged configuration:\n%s", pprint.pformat(safe_config))
+    # Log merged configuration (dump, mask and format only if it is emitted)
+    if logger.isEnabledFor(logging.INFO):
+        safe_config = mask_sensitive_data(config.model_dump())
+        logger.info("Merged configuration:\n%s", pprint.pformat(safe_config))
 
     return config
 
@@ -53,9 +57,7 @@ def mask_sensitive_data(data: Any) -> Any:
     """Recursively mask sensitive data in a dictionary."""
     if isinstance(data, dict):
         return {
-            k: mask_sensitive_data(v)
-            if k not in {"access_token", "client_secret", "keycloak_client_secret"}
-            else "********"
+            k: mask_sensitive_data(v) if k not in _SENSITIVE_KEYS else _MASK
             for k, v in data.items()
         }
     if isinstance(data, list):
@@ -72,10 +74,8 @@ def _format_validation_error(e: ValidationError) -> str:
     Returns:
         A formatted string summary of the errors.
     """
-    error_messages = []
-    for error in e.errors():
-        loc = ".".join(str(i) for i in error["loc"])
-        msg = error["msg"]
-        error_messages.append(f"  - {loc}: {msg}")
-
+    error_messages = [
+        f"  - {'.'.join(map(str, error['loc']))}: {error['msg']}"
+        for error in e.errors()
+    ]
     return "Configuration Error:\n" + "\n".join(error_messages)
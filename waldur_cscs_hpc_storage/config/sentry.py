@@ -1,7 +1,9 @@
 from typing import Optional
 
 from pydantic import Field, HttpUrl
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings
+
+from waldur_cscs_hpc_storage.config.common import SECTION_SETTINGS_CONFIG
 
 
 class SentryConfig(BaseSettings):
@@ -13,9 +15,4 @@ class SentryConfig(BaseSettings):
         None, alias="SENTRY_TRACES_SAMPLE_RATE", ge=0.0, le=1.0
     )
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        populate_by_name=True,
-        extra="ignore",
-    )
+    model_config = SECTION_SETTINGS_CONFIG
@@ -1,7 +1,12 @@
 from typing import Optional
 
 from pydantic import Field, HttpUrl, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings
+
+from waldur_cscs_hpc_storage.config.common import (
+    SECTION_SETTINGS_CONFIG,
+    check_proxy_url,
+)
 
 
 class WaldurApiConfig(BaseSettings):
@@ -19,20 +24,9 @@ class WaldurApiConfig(BaseSettings):
     socks_proxy: Optional[str] = Field(None, alias="WALDUR_SOCKS_PROXY")
     agent_header: Optional[str] = None
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        populate_by_name=True,
-        extra="ignore",
-    )
+    model_config = SECTION_SETTINGS_CONFIG
 
     @field_validator("socks_proxy")
     @classmethod
     def validate_proxy_url(cls, v: Optional[str]) -> Optional[str]:
-        if v:
-            allowed_schemes = ("socks5://", "socks5h://", "http://", "https://")
-            if not v.lower().startswith(allowed_schemes):
-                raise ValueError(
-                    f"Proxy URL must start with one of: {', '.join(allowed_schemes)}"
-                )
-        return v
+        return check_proxy_url(v)
@@ -15,6 +15,11 @@ from waldur_cscs_hpc_storage.mapper.state_mappers import (
     get_target_status_from_waldur_state,
     get_target_type_from_data_type,
 )
+from waldur_cscs_hpc_storage.mapper.storage_items import (
+    build_storage_data_type_item,
+    build_storage_file_system_item,
+    build_storage_system_item,
+)
 from waldur_cscs_hpc_storage.mapper.target_ids import (
     generate_customer_target_id,
     generate_project_target_id,
@@ -33,6 +38,9 @@ __all__ = [
     "QuotaCalculator",
     "ResourceMapper",
     "TARGET_STATUS_MAPPING",
+    "build_storage_data_type_item",
+    "build_storage_file_system_item",
+    "build_storage_system_item",
     "generate_customer_mount_point",
     "generate_customer_target_id",
     "generate_project_mount_point",
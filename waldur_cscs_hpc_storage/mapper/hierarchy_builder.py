@@ -10,7 +10,6 @@ from waldur_cscs_hpc_storage.models import (
     CustomerTargetItem,
     MountPoint,
     Permission,
-    StorageItem,
     StorageResource,
     Target,
     TenantTargetItem,
@@ -19,18 +18,23 @@ from waldur_cscs_hpc_storage.mapper.mount_points import (
     generate_customer_mount_point,
     generate_tenant_mount_point,
 )
+from waldur_cscs_hpc_storage.mapper.storage_items import (
+    build_storage_data_type_item,
+    build_storage_file_system_item,
+    build_storage_system_item,
+)
 from waldur_cscs_hpc_storage.mapper.target_ids import (
-    generate_storage_data_type_target_id,
-    generate_storage_filesystem_target_id,
-    generate_storage_system_target_id,
     generate_tenant_resource_id,
     generate_tenant_target_id,
 )
 
 logger = logging.getLogger(__name__)
 
+# Tenant and customer entries all carry the same (frozen) default permission
+_DEFAULT_PERMISSION = Permission(value="775")
+
 
-@dataclass
+@dataclass(slots=True)
 class CustomerInfo:
     key: str
     itemId: UUID
@@ -54,22 +58,23 @@ class HierarchyBuilder:
         Args:
             storage_file_system: The storage file system identifier (e.g., 'GPFS')
         """
-        self._tenant_entries: dict[str, UUID] = {}  # tenant_key -> itemId
-        self._customer_entries: dict[str, UUID] = {}  # customer_key -> itemId
+        # (slug, storage_system, storage_data_type) -> itemId
+        self._tenant_entries: dict[tuple[str, str, str], UUID] = {}
+        self._customer_entries: dict[tuple[str, str, str], UUID] = {}
         self._hierarchy_resources: list[StorageResource] = []
         self._storage_file_system = storage_file_system
 
     def _build_tenant_key(
         self, tenant_id: str, storage_system: str, storage_data_type: str
-    ) -> str:
+    ) -> tuple[str, str, str]:
         """Build a unique key for tenant entry deduplication."""
-        return f"{tenant_id}-{storage_system}-{storage_data_type}"
+        return (tenant_id, storage_system, storage_data_type)
 
     def _build_customer_key(
         self, customer_slug: str, storage_system: str, storage_data_type: str
-    ) -> str:
+    ) -> tuple[str, str, str]:
         """Build a unique key for customer entry deduplication."""
-        return f"{customer_slug}-{storage_system}-{storage_data_type}"
+        return (customer_slug, storage_system, storage_data_type)
 
     def get_or_create_tenant(
         self,
@@ -127,7 +132,7 @@ class HierarchyBuilder:
             itemId=tenant_item_id,
             status=status,
             mountPoint=MountPoint(default=mount_point),
-            permission=Permission(value="775"),
+            permission=_DEFAULT_PERMISSION,
             quotas=None,
             target=Target(
                 targetType=TargetType.TENANT,
@@ -139,22 +144,9 @@ class HierarchyBuilder:
                     name=tenant_name,
                 ),
             ),
-            storageSystem=StorageItem(
-                itemId=generate_storage_system_target_id(storage_system),
-                key=storage_system.lower(),
-                name=storage_system.upper(),
-            ),
-            storageFileSystem=StorageItem(
-                itemId=generate_storage_filesystem_target_id(self._storage_file_system),
-                key=self._storage_file_system.lower(),
-                name=self._storage_file_system.upper(),
-            ),
-            storageDataType=StorageItem(
-                itemId=generate_storage_data_type_target_id(storage_data_type),
-                key=storage_data_type.lower(),
-                name=storage_data_type.upper(),
-                path=storage_data_type.lower(),
-            ),
+            storageSystem=build_storage_system_item(storage_system),
+            storageFileSystem=build_storage_file_system_item(self._storage_file_system),
+            storageDataType=build_storage_data_type_item(storage_data_type),
             parentItemId=None,
         )
 
@@ -224,7 +216,7 @@ class HierarchyBuilder:
             itemId=customer_item_id,
             status=status,
             mountPoint=MountPoint(default=mount_point),
-            permission=Permission(value="775"),
+            permission=_DEFAULT_PERMISSION,
             quotas=None,
             target=Target(
                 targetType=TargetType.CUSTOMER,
@@ -234,22 +226,9 @@ class HierarchyBuilder:
                     name=customer_info.name,
                 ),
             ),
-            storageSystem=StorageItem(
-                itemId=generate_storage_system_target_id(storage_system),
-                key=storage_system.lower(),
-                name=storage_system.upper(),
-            ),
-            storageFileSystem=StorageItem(
-                itemId=generate_storage_filesystem_target_id(self._storage_file_system),
-                key=self._storage_file_system.lower(),
-                name=self._storage_file_system.upper(),
-            ),
-            storageDataType=StorageItem(
-                itemId=generate_storage_data_type_target_id(storage_data_type),
-                key=storage_data_type.lower(),
-                name=storage_data_type.upper(),
-                path=storage_data_type.lower(),
-            ),
+            storageSystem=build_storage_system_item(storage_system),
+            storageFileSystem=build_storage_file_system_item(self._storage_file_system),
+            storageDataType=build_storage_data_type_item(storage_data_type),
             parentItemId=parent_tenant_id,
         )
 
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Optional, List, Tuple
 
 from waldur_api_client.models.request_types import RequestTypes
@@ -26,6 +27,7 @@ class QuotaCalculator:
 
     def __init__(self, config: BackendConfig):
         self.config = config
+        self._build_quotas = lru_cache(maxsize=1024)(self._compute_quotas)
 
     def calculate_quotas(
         self,
@@ -39,63 +41,77 @@ class QuotaCalculator:
         limits = override_limits if override_limits is not None else resource.limits
         options = override_options if override_options is not None else resource.options
 
-        # Get storage limit
-        storage_limit = limits.storage or 0.0
+        quotas = self._build_quotas(
+            limits.storage or 0.0,
+            options.hard_quota_space,
+            options.soft_quota_inodes,
+            options.hard_quota_inodes,
+        )
+        # Callers get their own list; the (frozen) Quota objects are shared
+        return list(quotas) if quotas is not None else None
 
+    def _compute_quotas(
+        self,
+        storage_limit: float,
+        hard_quota_space: float | None,
+        soft_quota_inodes: int | None,
+        hard_quota_inodes: int | None,
+    ) -> tuple[Quota, ...] | None:
+        """
+        Build the quotas for a storage limit and its option overrides.
+
+        Wrapped per instance in an LRU cache by __init__: many resources share
+        the same limits, and the result only depends on these primitives and
+        the (frozen) backend config.
+        """
         # Calculate effective storage quotas (with option overrides)
         storage_quota_soft_tb = storage_limit
         storage_quota_hard_tb = (
-            options.hard_quota_space
-            if options.hard_quota_space is not None
-            else storage_limit
-        )
-
-        # Calculate base inode quotas
-        base_inodes = storage_limit * self.config.inode_base_multiplier
-        base_soft_inode = int(base_inodes * self.config.inode_soft_coefficient)
-        base_hard_inode = int(base_inodes * self.config.inode_hard_coefficient)
-
-        # Calculate effective inode quotas (with option overrides)
-        inode_soft = (
-            options.soft_quota_inodes
-            if options.soft_quota_inodes is not None
-            else base_soft_inode
-        )
-        inode_hard = (
-            options.hard_quota_inodes
-            if options.hard_quota_inodes is not None
-            else base_hard_inode
+            hard_quota_space if hard_quota_space is not None else storage_limit
         )
 
         if storage_quota_soft_tb <= 0 and storage_quota_hard_tb <= 0:
             return None
 
-        return [
-            Quota(
+        # Calculate effective inode quotas (with option overrides).
+        # The base inode quota is only derived for the values not overridden.
+        inode_soft = soft_quota_inodes
+        inode_hard = hard_quota_inodes
+        if inode_soft is None or inode_hard is None:
+            base_inodes = storage_limit * self.config.inode_base_multiplier
+            if inode_soft is None:
+                inode_soft = int(base_inodes * self.config.inode_soft_coefficient)
+            if inode_hard is None:
+                inode_hard = int(base_inodes * self.config.inode_hard_coefficient)
+
+        # Every field below is already an exact float or enum member, so the
+        # quotas are constructed without re-running pydantic validation.
+        return (
+            Quota.model_construct(
                 type=QuotaType.SPACE,
                 quota=float(storage_quota_soft_tb),
                 unit=QuotaUnit.TERA,
                 enforcementType=EnforcementType.SOFT,
             ),
-            Quota(
+            Quota.model_construct(
                 type=QuotaType.SPACE,
                 quota=float(storage_quota_hard_tb),
                 unit=QuotaUnit.TERA,
                 enforcementType=EnforcementType.HARD,
             ),
-            Quota(
+            Quota.model_construct(
                 type=QuotaType.INODES,
                 quota=float(inode_soft),
                 unit=QuotaUnit.NONE,
                 enforcementType=EnforcementType.SOFT,
             ),
-            Quota(
+            Quota.model_construct(
                 type=QuotaType.INODES,
                 quota=float(inode_hard),
                 unit=QuotaUnit.NONE,
                 enforcementType=EnforcementType.HARD,
             ),
-        ]
+        )
 
     def calculate_update_quotas(
         self, resource: ParsedWaldurResource
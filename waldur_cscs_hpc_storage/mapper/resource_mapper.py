@@ -1,5 +1,6 @@
 from uuid import UUID
 import logging
+import zlib
 from typing import Optional
 from uuid import uuid5, NAMESPACE_OID
 
@@ -17,7 +18,6 @@ from waldur_cscs_hpc_storage.models import (
     MountPoint,
     Permission,
     ProjectTargetItem,
-    StorageItem,
     StorageResource,
     Target,
     TargetItem,
@@ -31,12 +31,14 @@ from waldur_cscs_hpc_storage.mapper.mount_points import (
 from waldur_cscs_hpc_storage.models import (
     ParsedWaldurResource,
 )
+from waldur_cscs_hpc_storage.mapper.storage_items import (
+    build_storage_data_type_item,
+    build_storage_file_system_item,
+    build_storage_system_item,
+)
 from waldur_cscs_hpc_storage.mapper.target_ids import (
     generate_customer_target_id,
     generate_project_target_id,
-    generate_storage_data_type_target_id,
-    generate_storage_filesystem_target_id,
-    generate_storage_system_target_id,
     generate_tenant_target_id,
     generate_user_target_id,
 )
@@ -109,9 +111,14 @@ class ResourceMapper:
             storage_data_type_str, resource_uuid
         )
 
-        # 2. Build the Target Item (Project, User, etc.)
+        # 2. Determine Status once; it is shared by the resource and its target
+        cscs_status = get_target_status_from_waldur_state(waldur_resource.state)
+
+        # 3. Build the Target Item (Project, User, etc.)
         # This step involves GID lookups and might raise MissingIdentityError
-        target_item = await self._build_target_item(waldur_resource, target_type)
+        target_item = await self._build_target_item(
+            waldur_resource, target_type, target_status=cscs_status
+        )
 
         if not target_item:
             # Should be unreachable if build_target_item always returns item or raises
@@ -121,10 +128,10 @@ class ResourceMapper:
 
         target = Target(targetType=target_type, targetItem=target_item)
 
-        # 3. Calculate Quotas
+        # 4. Calculate Quotas
         quotas = self.quota_calculator.calculate_quotas(waldur_resource)
 
-        # 4. Calculate Pending Update Quotas (if applicable)
+        # 5. Calculate Pending Update Quotas (if applicable)
         old_quotas = None
         new_quotas = None
 
@@ -139,7 +146,7 @@ class ResourceMapper:
                 e,
             )
 
-        # 5. Generate Mount Point — use backend_id as path if set
+        # 6. Generate Mount Point — use backend_id as path if set
         if isinstance(waldur_resource.backend_id, str) and waldur_resource.backend_id:
             mount_point_path = waldur_resource.backend_id
         else:
@@ -151,9 +158,6 @@ class ResourceMapper:
                 data_type=storage_data_type_str,
             )
 
-        # 6. Determine Status
-        cscs_status = get_target_status_from_waldur_state(waldur_resource.state)
-
         # 7. Assemble the StorageResource
         return StorageResource(
             itemId=resource_uuid,
@@ -164,34 +168,25 @@ class ResourceMapper:
             oldQuotas=old_quotas,
             newQuotas=new_quotas,
             target=target,
-            storageSystem=StorageItem(
-                itemId=generate_storage_system_target_id(storage_system),
-                key=storage_system.lower(),
-                name=storage_system.upper(),
-            ),
-            storageFileSystem=StorageItem(
-                itemId=generate_storage_filesystem_target_id(
-                    self.config.storage_file_system
-                ),
-                key=self.config.storage_file_system.lower(),
-                name=self.config.storage_file_system.upper(),
-            ),
-            storageDataType=StorageItem(
-                itemId=generate_storage_data_type_target_id(storage_data_type_str),
-                key=storage_data_type_str.lower(),
-                name=storage_data_type_str.upper(),
-                path=storage_data_type_str.lower(),
+            storageSystem=build_storage_system_item(storage_system),
+            storageFileSystem=build_storage_file_system_item(
+                self.config.storage_file_system
             ),
+            storageDataType=build_storage_data_type_item(storage_data_type_str),
             parentItemId=parent_item_id,
             **waldur_resource.callback_urls,
         )
 
     async def _build_target_item(
-        self, waldur_resource: ParsedWaldurResource, target_type: TargetType
+        self,
+        waldur_resource: ParsedWaldurResource,
+        target_type: TargetType,
+        target_status: TargetStatus | None = None,
     ) -> Optional[TargetItem]:
         """
         Construct the specific TargetItem subclass based on the TargetType.
         Handles checking backend_metadata first, then falling back to generation/lookup.
+        target_status may be passed in when the caller has already mapped it.
         """
         if not self.config.use_mock_target_items:
             target_item_field = f"{target_type.value}_item"
@@ -201,11 +196,14 @@ class ResourceMapper:
             if pre_existing_data:
                 return pre_existing_data
 
+        if target_status is None:
+            target_status = get_target_status_from_waldur_state(waldur_resource.state)
+
         if target_type == TargetType.PROJECT:
-            return await self._build_project_target(waldur_resource)
+            return await self._build_project_target(waldur_resource, target_status)
 
         elif target_type == TargetType.USER:
-            return await self._build_user_target(waldur_resource)
+            return await self._build_user_target(waldur_resource, target_status)
 
         elif target_type == TargetType.TENANT:
             return TenantTargetItem(
@@ -225,10 +223,9 @@ class ResourceMapper:
         return TargetItem(itemId=uuid5(NAMESPACE_OID, "unknown"))
 
     async def _build_project_target(
-        self, waldur_resource: ParsedWaldurResource
+        self, waldur_resource: ParsedWaldurResource, target_status: TargetStatus
     ) -> Optional[ProjectTargetItem]:
         """Build ProjectTargetItem with GID lookup."""
-        target_status = get_target_status_from_waldur_state(waldur_resource.state)
         project_slug = waldur_resource.project_slug or "unknown"
 
         # Lookup GID
@@ -248,12 +245,11 @@ class ResourceMapper:
         )
 
     async def _build_user_target(
-        self, waldur_resource: ParsedWaldurResource
+        self, waldur_resource: ParsedWaldurResource, target_status: TargetStatus
     ) -> Optional[UserTargetItem]:
         """
         Build UserTargetItem.
         """
-        target_status = get_target_status_from_waldur_state(waldur_resource.state)
         project_slug = waldur_resource.project_slug or "default-project"
 
         # Lookup Primary Project GID
@@ -264,7 +260,7 @@ class ResourceMapper:
         # Placeholder logic from original backend.py
         # TODO: Implement actual User UID lookup logic if an API becomes available
         # e.g. https://api-user.hpc-user.tds.cscs.ch/api/v1/export/cscs/users/{username}
-        mock_uid = 20000 + hash(waldur_resource.slug) % 10000
+        mock_uid = 20000 + zlib.crc32(waldur_resource.slug.encode("utf-8")) % 10000
         mock_email = f"user-{waldur_resource.slug}@example.com"
 
         return UserTargetItem(
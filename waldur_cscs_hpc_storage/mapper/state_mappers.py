@@ -40,10 +40,9 @@ def get_target_status_from_waldur_state(state: ResourceState) -> TargetStatus:
     Returns:
         Corresponding TargetStatus enum value, defaults to PENDING for unknown states
     """
-    for rs, ts in TARGET_STATUS_MAPPING.items():
-        if str(rs) == state:
-            return ts
-    return TargetStatus.PENDING
+    # ResourceState is a str-based enum, so plain state strings hash and
+    # compare equal to their members and can be looked up directly.
+    return TARGET_STATUS_MAPPING.get(state, TargetStatus.PENDING)
 
 
 def get_target_type_from_data_type(
@@ -69,13 +68,9 @@ def get_target_type_from_data_type(
         logger.error(error_msg)
         raise TypeError(error_msg)
 
-    # Validate that storage_data_type is a supported type
-    try:
-        data_type_enum = StorageDataType(storage_data_type)
-    except ValueError:
-        data_type_enum = None
-
-    if data_type_enum is None or data_type_enum not in DATA_TYPE_TO_TARGET_MAPPING:
+    # StorageDataType is a StrEnum, so the raw string hashes like its member
+    # and membership can be checked without constructing the enum first.
+    if storage_data_type not in DATA_TYPE_TO_TARGET_MAPPING:
         logger.warning(
             "Unknown storage_data_type '%s' for resource %s, using default 'project' "
             "target type. Supported types: %s",
@@ -85,7 +80,7 @@ def get_target_type_from_data_type(
         )
         return TargetType.PROJECT
 
-    target_type = DATA_TYPE_TO_TARGET_MAPPING[data_type_enum]
+    target_type = DATA_TYPE_TO_TARGET_MAPPING[StorageDataType(storage_data_type)]
     logger.debug(
         "Mapped storage_data_type '%s' to target_type '%s'",
         storage_data_type,
@@ -0,0 +1,66 @@
+"""Shared StorageItem factories for storage systems, file systems and data types."""
+
+from functools import lru_cache
+
+from waldur_cscs_hpc_storage.mapper.target_ids import (
+    generate_storage_data_type_target_id,
+    generate_storage_filesystem_target_id,
+    generate_storage_system_target_id,
+)
+from waldur_cscs_hpc_storage.models import StorageItem
+
+
+@lru_cache(maxsize=256)
+def build_storage_system_item(storage_system: str) -> StorageItem:
+    """Build the StorageItem for a storage system.
+
+    The item is identical for every entry of the same system and StorageItem
+    is frozen, so one instance is shared by all resources and hierarchy nodes.
+
+    Args:
+        storage_system: Storage system name (e.g., 'capstor')
+
+    Returns:
+        Shared StorageItem instance
+    """
+    return StorageItem(
+        itemId=generate_storage_system_target_id(storage_system),
+        key=storage_system.lower(),
+        name=storage_system.upper(),
+    )
+
+
+@lru_cache(maxsize=256)
+def build_storage_file_system_item(storage_file_system: str) -> StorageItem:
+    """Build the StorageItem for a storage file system.
+
+    Args:
+        storage_file_system: Storage file system name (e.g., 'lustre')
+
+    Returns:
+        Shared StorageItem instance
+    """
+    return StorageItem(
+        itemId=generate_storage_filesystem_target_id(storage_file_system),
+        key=storage_file_system.lower(),
+        name=storage_file_system.upper(),
+    )
+
+
+@lru_cache(maxsize=256)
+def build_storage_data_type_item(storage_data_type: str) -> StorageItem:
+    """Build the StorageItem for a storage data type.
+
+    Args:
+        storage_data_type: Storage data type (e.g., 'store')
+
+    Returns:
+        Shared StorageItem instance
+    """
+    data_type_key = storage_data_type.lower()
+    return StorageItem(
+        itemId=generate_storage_data_type_target_id(storage_data_type),
+        key=data_type_key,
+        name=storage_data_type.upper(),
+        path=data_type_key,
+    )
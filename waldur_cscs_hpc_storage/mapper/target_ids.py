@@ -1,12 +1,17 @@
+from functools import lru_cache
 from uuid import UUID
 from uuid import NAMESPACE_OID, uuid5
 
 from waldur_cscs_hpc_storage.models.enums import TargetIdScope
 
 
+@lru_cache(maxsize=4096)
 def _generate_scoped_id(scope: TargetIdScope, identifier: str) -> UUID:
     """Generate a deterministic UUID given a scope and identifier.
 
+    Results are memoized: the same storage systems, tenants and customers
+    recur across every resource in a response, and uuid5 hashes each time.
+
     Args:
         scope: Target ID scope
         identifier: Unique identifier string
@@ -17,6 +17,8 @@ class Permission(BaseModel):
     value: str
     permissionType: str = "octal"
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Quota(BaseModel):
     """Represents a storage quota."""
@@ -26,6 +28,8 @@ class Quota(BaseModel):
     unit: QuotaUnit
     enforcementType: EnforcementType
 
+    model_config = ConfigDict(frozen=True)
+
 
 class StorageItem(BaseModel):
     """Represents a storage-related item (system, filesystem, or data type)."""
@@ -36,6 +40,9 @@ class StorageItem(BaseModel):
     active: bool = True
     path: str = ""  # Optional path field (used for data type)
 
+    # Instances are cached and shared across resources by the mapper
+    model_config = ConfigDict(frozen=True)
+
 
 class TargetItem(BaseModel):
     """Base class for target items."""
@@ -1,12 +1,12 @@
+import re
 from uuid import UUID
-from typing import Optional, Annotated
+from typing import Any, Optional, Annotated
 from pydantic import BaseModel, Field, field_validator, BeforeValidator
 
 from waldur_api_client.models.order_details import OrderDetails
 from waldur_api_client.models.order_state import OrderState
 from waldur_api_client.models.resource import Resource
 from waldur_api_client.models.resource_state import ResourceState
-from waldur_api_client.types import Unset
 
 # Re-importing Enums from your existing structure to ensure compatibility
 from waldur_cscs_hpc_storage.models.enums import (
@@ -24,8 +24,11 @@ from waldur_cscs_hpc_storage.models.domain import (
 
 # Helper for loose numeric parsing (handles "100.0" string for ints)
 def loose_int(v):
-    if v is None:
-        return None
+    # Exact type checks: bool must still go through the float round-trip
+    if v is None or type(v) is int:
+        return v
+    if type(v) is float:
+        return int(v)
     try:
         return int(float(v))
     except (ValueError, TypeError):
@@ -34,6 +37,22 @@ def loose_int(v):
 
 LooseInt = Annotated[Optional[int], BeforeValidator(loose_int)]
 
+_STORAGE_DATA_TYPES = {data_type.value: data_type for data_type in StorageDataType}
+
+# Same constraint as the permissions Field patterns, checked with one C-level
+# fullmatch on the trusted construction paths below.
+_PERMISSIONS_RE = re.compile(r"[0-7]{3,4}")
+
+# Order-level callback actions available in each order state
+_ORDER_ACTIONS_BY_STATE = {
+    OrderState.PENDING_PROVIDER: (
+        "approve_by_provider",
+        "reject_by_provider",
+        "set_state_done",
+    ),
+    OrderState.EXECUTING: ("set_state_done", "set_state_erred"),
+}
+
 
 class ResourceLimits(BaseModel):
     """
@@ -46,6 +65,20 @@ class ResourceLimits(BaseModel):
 
     model_config = {"extra": "ignore"}
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "ResourceLimits":
+        """Build limits from Waldur data, skipping validation when possible.
+
+        Falls back to full validation unless the storage limit is already
+        a non-negative number, so invalid input still raises.
+        """
+        storage = data.get("storage", 0)
+        if storage is None:
+            return cls.model_construct(storage=None)
+        if type(storage) in (int, float) and storage >= 0:
+            return cls.model_construct(storage=float(storage))
+        return cls(**data)
+
 
 class ResourceAttributes(BaseModel):
     """
@@ -66,13 +99,30 @@ class ResourceAttributes(BaseModel):
     @classmethod
     def validate_data_type(cls, v):
         # Handle cases where the API might send None or empty string
-        if not v:
-            return StorageDataType.STORE
-        try:
-            StorageDataType(v)
-            return v
-        except ValueError:
-            return StorageDataType.STORE
+        # Unknown values fall back to STORE via a dict lookup rather than
+        # constructing the enum and catching ValueError. The enum member is
+        # returned (members hash like their values), so the field's own enum
+        # validation only has to accept an existing instance.
+        if isinstance(v, str):
+            return _STORAGE_DATA_TYPES.get(v, StorageDataType.STORE)
+        return StorageDataType.STORE
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "ResourceAttributes":
+        """Build attributes from Waldur data, skipping validation when possible.
+
+        Falls back to full validation if the permissions value does not
+        already satisfy the field pattern, so invalid input still raises.
+        """
+        permissions = data.get("permissions", "775")
+        if not (
+            isinstance(permissions, str) and _PERMISSIONS_RE.fullmatch(permissions)
+        ):
+            return cls(**data)
+        return cls.model_construct(
+            storage_data_type=cls.validate_data_type(data.get("storage_data_type")),
+            permissions=permissions,
+        )
 
 
 class ResourceOptions(BaseModel):
@@ -99,6 +149,25 @@ class ResourceOptions(BaseModel):
 
     model_config = {"extra": "ignore"}
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "ResourceOptions":
+        """Build options from Waldur data, skipping validation when possible.
+
+        Only the common case without quota overrides takes the fast path;
+        quota values still go through loose parsing and range validation.
+        """
+        if (
+            data.get("hard_quota_space") is None
+            and data.get("soft_quota_inodes") is None
+            and data.get("hard_quota_inodes") is None
+        ):
+            permissions = data.get("permissions")
+            if permissions is None or (
+                isinstance(permissions, str) and _PERMISSIONS_RE.fullmatch(permissions)
+            ):
+                return cls.model_construct(permissions=permissions)
+        return cls(**data)
+
 
 class ResourceBackendMetadata(BaseModel):
     """
@@ -178,30 +247,29 @@ class ParsedWaldurResource(BaseModel):
             customer_slug=resource.customer_slug,
             provider_slug=(
                 resource.provider_slug
-                if hasattr(resource, "provider_slug")
-                and not isinstance(resource.provider_slug, Unset)
+                if isinstance(resource.provider_slug, str)
                 else ""
             ),
             provider_name=(
                 resource.provider_name
-                if hasattr(resource, "provider_name")
-                and not isinstance(resource.provider_name, Unset)
+                if isinstance(resource.provider_name, str)
                 else ""
             ),
             backend_id=(
-                resource.backend_id
-                if hasattr(resource, "backend_id")
-                and isinstance(resource.backend_id, str)
-                else None
+                resource.backend_id if isinstance(resource.backend_id, str) else None
             ),
             limits=resource.limits
-            and ResourceLimits(**resource.limits.additional_properties)
+            and ResourceLimits.from_trusted_dict(resource.limits.additional_properties)
             or ResourceLimits(),
             attributes=resource.attributes
-            and ResourceAttributes(**resource.attributes.additional_properties)
+            and ResourceAttributes.from_trusted_dict(
+                resource.attributes.additional_properties
+            )
             or ResourceAttributes(),
             options=resource.options
-            and ResourceOptions(**resource.options)
+            and ResourceOptions.from_trusted_dict(
+                resource.options.additional_properties
+            )
             or ResourceOptions(),
             backend_metadata=resource.backend_metadata
             and ResourceBackendMetadata(
@@ -221,34 +289,20 @@ class ParsedWaldurResource(BaseModel):
         """
         Get callback URLs for the given Waldur resource.
         """
-        try:
-            order = self.order_in_progress
-            if not order:
-                return {}
-
-            order_state = getattr(order, "state", None)
-            order_url = getattr(order, "url", None)
-
-            if not order_url:
-                return {}
+        order = self.order_in_progress
+        if not order:
+            return {}
 
-        except AttributeError:
+        order_url = getattr(order, "url", None)
+        if not order_url:
             return {}
+        order_state = getattr(order, "state", None)
 
         # Order-level actions (approve, reject, set_state_done, set_state_erred)
-        order_actions = set()
-
-        if order_state == OrderState.PENDING_PROVIDER:
-            order_actions.update(
-                [
-                    "approve_by_provider",
-                    "reject_by_provider",
-                    "set_state_done",
-                ]
-            )
-
-        if order_state == OrderState.EXECUTING:
-            order_actions.update(["set_state_done", "set_state_erred"])
+        # The state may be unset on the order, which has no actions
+        order_actions: tuple[str, ...] = ()
+        if isinstance(order_state, OrderState):
+            order_actions = _ORDER_ACTIONS_BY_STATE.get(order_state, ())
 
         base = order_url.rstrip("/")
         urls = {f"{action}_url": f"{base}/{action}/" for action in order_actions}
@@ -293,3 +347,9 @@ class StorageResourceFilter(BaseModel):
         Optional[TargetStatus],
         Field(description="Status filter"),
     ] = None
+    # Left unset (None) unless given, so it only shows up in filters_applied
+    # when the caller asked for it; None behaves like True.
+    include_hierarchy: Annotated[
+        bool | None,
+        Field(description="Include tenant and customer hierarchy entries"),
+    ] = None
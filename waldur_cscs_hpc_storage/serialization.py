@@ -15,17 +15,23 @@ class UUIDEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Encoders are stateless once configured, so the common configurations are
+# built once instead of on every json.dumps call.
+_DEFAULT_ENCODER = UUIDEncoder()
+_RESPONSE_ENCODER = UUIDEncoder(
+    ensure_ascii=False,
+    allow_nan=False,
+    indent=None,
+    separators=(",", ":"),
+)
+
+
 def dump_json(obj: Any, **kwargs) -> str:
+    if not kwargs:
+        return _DEFAULT_ENCODER.encode(obj)
     return json.dumps(obj, cls=UUIDEncoder, **kwargs)
 
 
 class JSONResponse(StarletteJSONResponse):
     def render(self, content: Any) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-            cls=UUIDEncoder,
-        ).encode("utf-8")
+        return _RESPONSE_ENCODER.encode(content).encode("utf-8")
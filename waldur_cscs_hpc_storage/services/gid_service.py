@@ -1,6 +1,7 @@
 """CSCS HPC User API client implementation."""
 
 import logging
+import zlib
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -197,9 +198,9 @@ class GidService:
             project_slug: Project slug to generate mock GID for
 
         Returns:
-            Mock GID value (30000 + hash-based offset)
+            Mock GID value (30000 + CRC32-based offset, stable across restarts)
         """
-        return 30000 + hash(project_slug) % 10000
+        return 30000 + zlib.crc32(project_slug.encode("utf-8")) % 10000
 
     async def batch_resolve_gids(self, project_slugs: list[str]) -> dict[str, int]:
         """Resolve GIDs for multiple project slugs in a single API call.
@@ -212,8 +213,10 @@ class GidService:
         Returns:
             Dict mapping project slug to unix GID for successfully resolved projects
         """
-        # Filter out already-cached slugs
-        uncached_slugs = [s for s in project_slugs if s not in self._gid_cache]
+        # Filter out already-cached slugs; many resources share a project, so
+        # each slug is requested only once
+        unique_slugs = list(dict.fromkeys(project_slugs))
+        uncached_slugs = [s for s in unique_slugs if s not in self._gid_cache]
 
         if not uncached_slugs:
             logger.debug("All %d project slugs found in cache", len(project_slugs))
@@ -223,8 +226,8 @@ class GidService:
 
         logger.info(
             "Batch resolving GIDs for %d projects (%d cached, %d to fetch)",
-            len(project_slugs),
-            len(project_slugs) - len(uncached_slugs),
+            len(unique_slugs),
+            len(unique_slugs) - len(uncached_slugs),
             len(uncached_slugs),
         )
 
@@ -264,12 +267,11 @@ class GidService:
             unixGid if found, mock value (dev mode), or None (prod mode on failure)
         """
         if project_slug in self._gid_cache:
+            cached_gid = self._gid_cache[project_slug]
             logger.debug(
-                "Found cached unixGid %d for project %s",
-                self._gid_cache[project_slug],
-                project_slug,
+                "Found cached unixGid %d for project %s", cached_gid, project_slug
             )
-            return self._gid_cache[project_slug]
+            return cached_gid
 
         try:
             projects_data = await self.get_projects([project_slug])
@@ -1,6 +1,7 @@
 """Mock GID service for development/testing without HPC User API."""
 
 import logging
+import zlib
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -34,9 +35,9 @@ class MockGidService:
             project_slug: Project slug to generate mock GID for
 
         Returns:
-            Mock GID value (30000 + hash-based offset)
+            Mock GID value (30000 + CRC32-based offset, stable across restarts)
         """
-        return 30000 + hash(project_slug) % 10000
+        return 30000 + zlib.crc32(project_slug.encode("utf-8")) % 10000
 
     async def batch_resolve_gids(self, project_slugs: list[str]) -> dict[str, int]:
         """Batch resolve GIDs for multiple project slugs.
@@ -81,12 +82,13 @@ class MockGidService:
 
         # Check cache first
         if project_slug in self._gid_cache:
+            cached_gid = self._gid_cache[project_slug]
             logger.debug(
                 "Found cached mock unixGid %d for project %s",
-                self._gid_cache[project_slug],
+                cached_gid,
                 project_slug,
             )
-            return self._gid_cache[project_slug]
+            return cached_gid
 
         # Generate and cache mock GID
         mock_gid = self._generate_mock_gid(project_slug)
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
+from uuid import UUID
 
 
 from waldur_cscs_hpc_storage.models.enums import StorageDataType, TargetStatus
@@ -55,11 +57,12 @@ class StorageOrchestrator:
 
         Flow:
         1. Fetch raw resources from Waldur API based on offering slugs and state.
-        2. Fetch associated customer metadata for hierarchy naming.
-        3. Build the resource hierarchy (Tenant -> Customer -> Project).
-        4. Map raw resources to StorageResource objects.
-        5. Apply post-fetch filters (data_type, status).
-        6. Calculate pagination and format response.
+        2. Drop raw resources that do not match the data_type filter.
+        3. Fetch associated customer metadata for hierarchy naming.
+        4. Build the resource hierarchy (Tenant -> Customer -> Project).
+        5. Map raw resources to StorageResource objects.
+        6. Apply post-fetch filters (data_type, status).
+        7. Calculate pagination and format response.
         """
         # Fetch resources for the specific storage_system
         if filters.storage_system:
@@ -84,13 +87,25 @@ class StorageOrchestrator:
             state=waldur_state,
         )
 
-        # 3. Process resources if any exist
+        # 3. Drop resources of other data types before any per-resource work
+        # (customer lookups, GID resolution, hierarchy and target mapping).
+        # Waldur has no query parameter for the storage_data_type attribute,
+        # so this is the earliest point the filter can be applied.
+        if filters.data_type and raw_resources:
+            raw_resources = self._filter_raw_resources_by_data_type(
+                raw_resources, filters.data_type
+            )
+
+        # 4. Process resources if any exist
         if raw_resources:
-            processed_resources = await self._process_resources(raw_resources)
+            processed_resources = await self._process_resources(
+                raw_resources,
+                include_hierarchy=filters.include_hierarchy is not False,
+            )
         else:
             processed_resources = []
 
-        # 4. Apply post-processing filters (Memory-side filtering)
+        # 5. Apply post-processing filters (Memory-side filtering)
         # Note: We filter *after* hierarchy building because the API
         # might return a 'Project' that we want, but we also need its
         # 'Tenant' and 'Customer' parents which are generated locally.
@@ -100,7 +115,7 @@ class StorageOrchestrator:
             processed_resources, filters.data_type, filters.status
         )
 
-        # 5. Paginate the filtered results locally
+        # 6. Paginate the filtered results locally
         extra_filters = {
             "offering_slugs": offering_slugs,
         }
@@ -112,25 +127,54 @@ class StorageOrchestrator:
         )
 
     async def _process_resources(
-        self, raw_resources: List[ParsedWaldurResource]
+        self,
+        raw_resources: List[ParsedWaldurResource],
+        include_hierarchy: bool = True,
     ) -> List[StorageResource]:
         """
         Core loop: Metadata fetching, Hierarchy building, and Resource Mapping.
+
+        With include_hierarchy disabled, the customer lookups and the
+        Tenant/Customer entries are skipped and only the mapped project/user
+        resources are returned, without a parentItemId.
         """
         # A. Pre-fetch Customer Metadata for efficient Hierarchy building
-        # We need distinct offering UUIDs to query the customers endpoint
-        offering_uuids = {r.offering_uuid for r in raw_resources}
-        all_offering_customers = {}
+        # We need distinct offering UUIDs to query the customers endpoint.
+        # The lookups are independent, so they run concurrently together
+        # with the batched GID pre-fetch for all distinct projects.
+        # Both distinct-key collections are built in one ordered pass.
+        offering_uuid_keys: dict[UUID, None] = {}
+        project_slug_keys: dict[str, None] = {}
+        for r in raw_resources:
+            offering_uuid_keys[r.offering_uuid] = None
+            if r.project_slug:
+                project_slug_keys[r.project_slug] = None
+        offering_uuids = list(offering_uuid_keys) if include_hierarchy else []
+        project_slugs = list(project_slug_keys)
+
+        # A TaskGroup cancels the remaining lookups as soon as one fails.
+        # The first failure is re-raised unwrapped so the API exception
+        # handlers still see e.g. a WaldurClientError.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                customer_tasks = [
+                    tg.create_task(
+                        self.waldur_service.get_offering_customers(offering_uuid)
+                    )
+                    for offering_uuid in offering_uuids
+                ]
+                if project_slugs:
+                    tg.create_task(
+                        self.mapper.gid_service.batch_resolve_gids(project_slugs)
+                    )
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+        offering_customers = [task.result() for task in customer_tasks]
 
-        for offering_uuid in offering_uuids:
-            customers = await self.waldur_service.get_offering_customers(offering_uuid)
+        all_offering_customers = {}
+        for customers in offering_customers:
             all_offering_customers.update(customers)
 
-        # A2. Batch pre-fetch GIDs for all projects in a single API call
-        project_slugs = [r.project_slug for r in raw_resources if r.project_slug]
-        if project_slugs:
-            await self.mapper.gid_service.batch_resolve_gids(project_slugs)
-
         # B. Initialize a fresh HierarchyBuilder for this request
         hierarchy_builder = HierarchyBuilder(
             self.config.backend_settings.storage_file_system
@@ -140,24 +184,27 @@ class StorageOrchestrator:
         logger.debug("Processing %d raw resources", len(raw_resources))
 
         for resource in raw_resources:
-            try:
-                # 1. Identify Storage System and Data Type
-                # The offering_slug corresponds to the storage system (e.g., 'capstor')
-                storage_system = resource.offering_slug
-                storage_data_type_str = (
-                    resource.attributes.storage_data_type or StorageDataType.STORE.value
-                )
-
+            # 1. Read the fields shared by every step below once.
+            # The offering_slug corresponds to the storage system (e.g., 'capstor')
+            storage_system = resource.offering_slug
+            storage_data_type_str = (
+                resource.attributes.storage_data_type or StorageDataType.STORE.value
+            )
+            customer_slug = resource.customer_slug
+            tenant_id = resource.provider_slug
+            backend_id = resource.backend_id
+
+            customer_id = None
+            if include_hierarchy:
                 # 2. Derive mount point overrides from backend_id
                 tenant_mount_override = None
                 customer_mount_override = None
-                if resource.backend_id:
+                if backend_id:
                     tenant_mount_override, customer_mount_override = (
-                        derive_parent_mount_points(resource.backend_id)
+                        derive_parent_mount_points(backend_id)
                     )
 
                 # 3. Register Tenant (Top Level)
-                tenant_id = resource.provider_slug
                 tenant_name = resource.provider_name or tenant_id.upper()
 
                 hierarchy_builder.get_or_create_tenant(
@@ -170,9 +217,10 @@ class StorageOrchestrator:
                 )
 
                 # 4. Register Customer (Mid Level)
-                if resource.customer_slug in all_offering_customers:
-                    customer_info = all_offering_customers[resource.customer_slug]
-                    hierarchy_builder.get_or_create_customer(
+                # The returned itemId is the parent we link the project to
+                customer_info = all_offering_customers.get(customer_slug)
+                if customer_info is not None:
+                    customer_id = hierarchy_builder.get_or_create_customer(
                         customer_info=customer_info,
                         storage_system=storage_system,
                         storage_data_type=storage_data_type_str,
@@ -180,23 +228,15 @@ class StorageOrchestrator:
                         mount_point_override=customer_mount_override,
                     )
 
-                # 5. Map the Project/User Resource (Bottom Level)
-                # We need the parent ID (Customer ID) to link the project correctly
-                customer_id = hierarchy_builder.get_customer_uuid(
-                    customer_slug=resource.customer_slug,
-                    storage_system=storage_system,
-                    storage_data_type=storage_data_type_str,
-                )
-
+            # 5. Map the Project/User Resource (Bottom Level)
+            # Mapping is the only step that raises ResourceProcessingError
+            # (e.g. a missing unixGid in production); such resources are skipped.
+            try:
                 mapped_resource = await self.mapper.map_resource(
                     waldur_resource=resource,
                     storage_system=storage_system,
                     parent_item_id=customer_id,
                 )
-
-                if mapped_resource:
-                    project_resources.append(mapped_resource)
-
             except ResourceProcessingError as e:
                 logger.warning(
                     "Skipping resource %s due to processing error: %s",
@@ -205,9 +245,34 @@ class StorageOrchestrator:
                 )
                 continue
 
+            if mapped_resource:
+                project_resources.append(mapped_resource)
+
         # Combine generated hierarchy nodes (Tenants/Customers) with mapped project nodes
-        # The hierarchy nodes must come first in the list
-        return hierarchy_builder.get_hierarchy_resources() + project_resources
+        # The hierarchy nodes must come first in the list. The builder already
+        # returns a fresh list, so the project nodes are appended to it in place.
+        resources = hierarchy_builder.get_hierarchy_resources()
+        resources.extend(project_resources)
+        return resources
+
+    def _filter_raw_resources_by_data_type(
+        self,
+        raw_resources: list[ParsedWaldurResource],
+        data_type: StorageDataType,
+    ) -> list[ParsedWaldurResource]:
+        """
+        Keep only raw resources whose storage data type matches the filter.
+
+        Resources without an explicit storage_data_type attribute are treated
+        as 'store', matching the default used when building the hierarchy.
+        """
+        default_type = StorageDataType.STORE.value
+        wanted_type = data_type.value
+        return [
+            resource
+            for resource in raw_resources
+            if (resource.attributes.storage_data_type or default_type) == wanted_type
+        ]
 
     def _filter_resources(
         self,
@@ -218,25 +283,23 @@ class StorageOrchestrator:
         """
         Apply filtering predicates to the processed list of resources.
         """
-        if not data_type and not status:
-            return resources
-
-        filtered = []
-        for res in resources:
-            # Filter by Data Type
-            if data_type:
-                # Access the 'key' or 'value' from the StorageItem
-                # The StorageItem.key is lowercase (e.g., 'store')
-                res_type = res.storageDataType.key
-                if res_type != data_type.value:
-                    continue
-
-            # Filter by Status
-            if status:
-                # res.status is a TargetStatus enum
-                if res.status != status:
-                    continue
-
-            filtered.append(res)
-
-        return filtered
+        if not data_type:
+            if not status:
+                return resources
+            return [res for res in resources if res.status == status]
+
+        # Resolve the wanted values once; the StorageItem.key is lowercase
+        # (e.g., 'store') and res.status is a TargetStatus enum.
+        # Each filter combination gets its own comprehension so inactive
+        # filters are not re-checked for every resource. When both are set,
+        # status is checked first: it is the more selective filter and a
+        # direct attribute read instead of a nested one.
+        wanted_type = data_type.value
+        if not status:
+            return [res for res in resources if res.storageDataType.key == wanted_type]
+
+        return [
+            res
+            for res in resources
+            if res.status == status and res.storageDataType.key == wanted_type
+        ]
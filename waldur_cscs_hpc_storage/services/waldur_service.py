@@ -19,7 +19,7 @@ from waldur_cscs_hpc_storage.mapper import CustomerInfo
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WaldurResourceResponse:
     resources: list[ParsedWaldurResource]
     total_count: int
@@ -41,6 +41,18 @@ def test_mask_sensitive_data():
     assert masked["list_data"][1]["safe"] == "value"
     assert masked["safe_field"] == "safe"
 
+    # The input is left untouched
+    assert data["waldur_api"]["access_token"] == "secret-token"
+    assert data["list_data"][0]["client_secret"] == "nested-secret"
+
+
+def test_mask_sensitive_data_nested_lists_and_scalars():
+    """Test that nested lists keep their order and scalars pass through."""
+    data = [[{"access_token": "secret"}, 1], "two", None]
+
+    assert mask_sensitive_data(data) == [[{"access_token": "********"}, 1], "two", None]
+    assert mask_sensitive_data("value") == "value"
+
 
 @mock.patch("waldur_cscs_hpc_storage.config.parser.logging.basicConfig")
 @mock.patch("waldur_cscs_hpc_storage.config.parser.logger")
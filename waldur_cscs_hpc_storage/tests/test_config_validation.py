@@ -31,6 +31,13 @@ class TestBackendConfigValidation:
             BackendConfig(inode_soft_coefficient=2.0, inode_hard_coefficient=1.5)
         assert "must be greater than inode_soft_coefficient" in str(excinfo.value)
 
+    def test_config_is_immutable(self):
+        """Test that a loaded configuration cannot be changed at runtime."""
+        config = BackendConfig()
+
+        with pytest.raises(ValidationError):
+            config.storage_file_system = "gpfs"
+
     def test_numeric_constraints(self):
         """Test gt=0 constraints for numeric fields."""
         # inode_soft_coefficient
@@ -1,5 +1,6 @@
 """Tests for CSCS HPC User API client."""
 
+import zlib
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -297,6 +298,13 @@ class TestGidService:
         # Should NOT make any API calls
         mock_client_class.assert_not_called()
 
+    def test_generate_mock_gid_is_stable(self, gid_service):
+        """Test that mock GIDs do not depend on per-process string hashing."""
+        assert gid_service._generate_mock_gid("project-a") == 30000 + (
+            zlib.crc32(b"project-a") % 10000
+        )
+        assert 30000 <= gid_service._generate_mock_gid("project-b") < 40000
+
     @pytest.mark.asyncio
     @patch("waldur_cscs_hpc_storage.services.gid_service.httpx.AsyncClient")
     async def test_get_project_unix_gid_not_found(self, mock_client_class, gid_service):
@@ -474,6 +482,39 @@ class TestGidService:
         call_args = mock_client_instance.get.call_args
         assert call_args[1]["params"]["projects"] == ["proj2"]
 
+    @pytest.mark.asyncio
+    @patch("waldur_cscs_hpc_storage.services.gid_service.httpx.AsyncClient")
+    async def test_batch_resolve_gids_deduplicates_slugs(
+        self, mock_client_class, gid_service
+    ):
+        """Test batch GID resolution requests each project slug only once."""
+        from datetime import timedelta
+
+        future_time = datetime.now(tz=timezone.utc) + timedelta(hours=1)
+        gid_service._token = "test_token"
+        gid_service._token_expires_at = future_time
+
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "projects": [
+                {"posixName": "proj1", "unixGid": 1001},
+                {"posixName": "proj2", "unixGid": 1002},
+            ]
+        }
+        mock_response.raise_for_status.return_value = None
+
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get.return_value = mock_response
+        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+
+        result = await gid_service.batch_resolve_gids(
+            ["proj1", "proj2", "proj1", "proj2", "proj1"]
+        )
+
+        assert result == {"proj1": 1001, "proj2": 1002}
+        call_args = mock_client_instance.get.call_args
+        assert call_args[1]["params"]["projects"] == ["proj1", "proj2"]
+
     @pytest.mark.asyncio
     async def test_batch_resolve_gids_all_cached(self, gid_service):
         """Test batch GID resolution returns immediately when all slugs are cached."""
@@ -129,6 +129,12 @@ class TestHierarchyBuilder:
         assert customer_resource.target.targetItem.name == "ETH Zurich"
         assert str(customer_resource.parentItemId) == tenant_uuid
 
+        assert customer_resource.storageSystem.key == "capstor"
+        assert customer_resource.storageDataType.name == "STORE"
+        assert customer_resource.storageDataType.path == "store"
+        assert customer_resource.permission is resources[0].permission
+        assert customer_resource.permission.value == "775"
+
     def test_get_or_create_customer_existing(self, builder):
         """Test that second call to get_or_create_customer returns the same ID."""
         tenant_uuid = str(make_test_uuid("tenant-uuid"))
@@ -1,5 +1,6 @@
 """Tests for CSCS HPC Storage Orchestrator."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
@@ -14,7 +15,12 @@ from waldur_cscs_hpc_storage.config import (
     StorageProxyConfig,
     WaldurApiConfig,
 )
-from waldur_cscs_hpc_storage.mapper import QuotaCalculator, ResourceMapper
+from waldur_cscs_hpc_storage.exceptions import WaldurClientError
+from waldur_cscs_hpc_storage.mapper import (
+    CustomerInfo,
+    QuotaCalculator,
+    ResourceMapper,
+)
 from waldur_cscs_hpc_storage.mapper.mount_points import generate_project_mount_point
 from waldur_cscs_hpc_storage.models import (
     Quota,
@@ -791,6 +797,30 @@ class TestStorageOrchestrator(TestStorageOrchestratorBase):
         assert len(filtered) == 1
         assert filtered[0].storageDataType.key == "scratch"
 
+    def test_filtering_raw_resources_by_data_type(self):
+        """Test that raw resources are pre-filtered by storage data type."""
+        r1 = Mock()
+        r1.attributes.storage_data_type = "store"
+
+        r2 = Mock()
+        r2.attributes.storage_data_type = "users"
+
+        # Resources without an explicit data type default to 'store'
+        r3 = Mock()
+        r3.attributes.storage_data_type = None
+
+        raw_resources = [r1, r2, r3]
+
+        filtered = self.orchestrator._filter_raw_resources_by_data_type(
+            raw_resources, StorageDataType.STORE
+        )
+        assert filtered == [r1, r3]
+
+        filtered = self.orchestrator._filter_raw_resources_by_data_type(
+            raw_resources, StorageDataType.USERS
+        )
+        assert filtered == [r2]
+
     def test_filtering_by_status(self):
         """Test filtering storage resources by status."""
         # Create mock storage resources with different statuses
@@ -934,6 +964,176 @@ class TestStorageOrchestrator(TestStorageOrchestratorBase):
         assert result["pagination"]["current"] == 2
         assert result["pagination"]["limit"] == 50
 
+    @pytest.mark.asyncio
+    async def test_include_hierarchy_reported_only_when_set(self):
+        """Test that include_hierarchy is only listed in filters_applied when given."""
+        self.orchestrator.waldur_service.list_all_resources = AsyncMock(return_value=[])
+
+        result = await self.orchestrator.get_resources(filters=StorageResourceFilter())
+        assert "include_hierarchy" not in result["filters_applied"]
+
+        result = await self.orchestrator.get_resources(
+            filters=StorageResourceFilter(include_hierarchy=False)
+        )
+        assert result["filters_applied"]["include_hierarchy"] is False
+
+    @pytest.mark.asyncio
+    async def test_customer_and_gid_lookups_run_concurrently(self):
+        """Test that customer and GID lookups run concurrently and are merged."""
+        offering_a = uuid4()
+        offering_b = uuid4()
+        customers_by_offering = {
+            offering_a: {
+                "uni-a": CustomerInfo(itemId=uuid4().hex, key="uni-a", name="Uni A")
+            },
+            offering_b: {
+                "uni-b": CustomerInfo(itemId=uuid4().hex, key="uni-b", name="Uni B")
+            },
+        }
+        in_flight = 0
+        max_in_flight = 0
+
+        async def track(result):
+            # Yield once so concurrently started lookups overlap here
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return result
+
+        async def get_offering_customers(offering_uuid):
+            return await track(customers_by_offering[offering_uuid])
+
+        async def batch_resolve_gids(project_slugs):
+            return await track({})
+
+        self.orchestrator.waldur_service.get_offering_customers = AsyncMock(
+            side_effect=get_offering_customers
+        )
+        self.orchestrator.mapper.gid_service.batch_resolve_gids = AsyncMock(
+            side_effect=batch_resolve_gids
+        )
+        self.orchestrator.mapper.map_resource = AsyncMock(return_value=None)
+
+        raw_resources = []
+        for offering_uuid, customer_slug in [
+            (offering_a, "uni-a"),
+            (offering_a, "uni-a"),
+            (offering_b, "uni-b"),
+        ]:
+            resource = Mock()
+            resource.offering_uuid = offering_uuid
+            resource.offering_slug = "capstor"
+            resource.provider_slug = "cscs"
+            resource.provider_name = "CSCS"
+            resource.customer_slug = customer_slug
+            resource.project_slug = f"{customer_slug}-project"
+            resource.backend_id = None
+            resource.attributes.storage_data_type = "store"
+            raw_resources.append(resource)
+
+        result = await self.orchestrator._process_resources(raw_resources)
+
+        assert self.orchestrator.waldur_service.get_offering_customers.await_count == 2
+        self.orchestrator.mapper.gid_service.batch_resolve_gids.assert_awaited_once_with(
+            ["uni-a-project", "uni-b-project"]
+        )
+        # Both customer lookups and the GID batch were in flight together
+        assert max_in_flight == 3
+        customer_names = {
+            r.target.targetItem.name
+            for r in result
+            if r.target.targetType == "customer"
+        }
+        assert customer_names == {"Uni A", "Uni B"}
+
+    @pytest.mark.asyncio
+    async def test_failed_customer_lookup_cancels_gid_batch(self):
+        """Test that a failed customer lookup cancels the GID batch and is re-raised."""
+        gid_batch_cancelled = False
+
+        async def batch_resolve_gids(project_slugs):
+            nonlocal gid_batch_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                gid_batch_cancelled = True
+                raise
+
+        self.orchestrator.waldur_service.get_offering_customers = AsyncMock(
+            side_effect=WaldurClientError("customers unavailable")
+        )
+        self.orchestrator.mapper.gid_service.batch_resolve_gids = AsyncMock(
+            side_effect=batch_resolve_gids
+        )
+
+        resource = Mock()
+        resource.offering_uuid = uuid4()
+        resource.project_slug = "uni-a-project"
+
+        with pytest.raises(WaldurClientError, match="customers unavailable"):
+            await self.orchestrator._process_resources([resource])
+        assert gid_batch_cancelled
+
+    @pytest.mark.asyncio
+    async def test_shared_parents_listed_once(self):
+        """Test that resources sharing tenant and customer list parents once."""
+        offering_uuid = uuid4()
+        customer_id = uuid4().hex
+        self.orchestrator.waldur_service.get_offering_customers = AsyncMock(
+            return_value={
+                "uni": CustomerInfo(itemId=customer_id, key="uni", name="Uni")
+            }
+        )
+        self.orchestrator.mapper.map_resource = AsyncMock(return_value=None)
+
+        raw_resources = []
+        for _ in range(3):
+            resource = Mock()
+            resource.offering_uuid = offering_uuid
+            resource.offering_slug = "capstor"
+            resource.provider_slug = "cscs"
+            resource.provider_name = "CSCS"
+            resource.customer_slug = "uni"
+            resource.project_slug = None
+            resource.backend_id = None
+            resource.attributes.storage_data_type = "store"
+            raw_resources.append(resource)
+
+        result = await self.orchestrator._process_resources(raw_resources)
+
+        # The hierarchy builder dedupes the shared tenant and customer entries
+        assert [r.target.targetType for r in result] == ["tenant", "customer"]
+        for call in self.orchestrator.mapper.map_resource.await_args_list:
+            assert call.kwargs["parent_item_id"] == customer_id
+
+    @pytest.mark.asyncio
+    async def test_process_resources_without_hierarchy(self):
+        """Test that disabling the hierarchy skips customer lookups and parents."""
+        self.orchestrator.waldur_service.get_offering_customers = AsyncMock(
+            return_value={}
+        )
+        mapped = Mock()
+        self.orchestrator.mapper.map_resource = AsyncMock(return_value=mapped)
+
+        resource = Mock()
+        resource.offering_uuid = uuid4()
+        resource.offering_slug = "capstor"
+        resource.provider_slug = "cscs"
+        resource.customer_slug = "uni"
+        resource.project_slug = None
+        resource.attributes.storage_data_type = "store"
+
+        result = await self.orchestrator._process_resources(
+            [resource], include_hierarchy=False
+        )
+
+        assert result == [mapped]
+        self.orchestrator.waldur_service.get_offering_customers.assert_not_called()
+        call = self.orchestrator.mapper.map_resource.await_args
+        assert call.kwargs["parent_item_id"] is None
+
     @pytest.mark.asyncio
     async def test_status_filter_pushed_to_waldur_as_state(self):
         """Test that status filter is converted to Waldur state and pushed to API."""
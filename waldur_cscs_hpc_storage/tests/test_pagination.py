@@ -1,3 +1,5 @@
+from uuid import UUID, uuid4
+
 from pydantic import BaseModel
 from waldur_cscs_hpc_storage.utils import paginate_response
 
@@ -11,6 +13,10 @@ class MockResource(BaseModel):
     id: int
 
 
+class MockUUIDResource(BaseModel):
+    itemId: UUID
+
+
 def test_paginate_response_with_total_count():
     resources = [MockResource(id=i) for i in range(5)]
     filters = MockFilter(page=1, page_size=10)
@@ -50,6 +56,19 @@ def test_paginate_response_without_total_count():
     assert pagination["has_next"] is False
 
 
+def test_paginate_response_partial_last_page():
+    resources = [MockResource(id=i) for i in range(10)]
+    filters = MockFilter(page=5, page_size=10)
+
+    # 51 items need a sixth page for the remaining item
+    response = paginate_response(resources, filters, total_count=51)
+
+    pagination = response["pagination"]
+    assert pagination["total"] == 51
+    assert pagination["pages"] == 6
+    assert pagination["has_next"] is True
+
+
 def test_paginate_response_empty():
     resources = []
     filters = MockFilter(page=1, page_size=10)
@@ -60,3 +79,13 @@ def test_paginate_response_empty():
     assert pagination["total"] == 0
     assert pagination["pages"] == 0
     assert pagination["has_next"] is False
+
+
+def test_paginate_response_serializes_to_json_primitives():
+    item_id = uuid4()
+    resources = [MockUUIDResource(itemId=item_id)]
+    filters = MockFilter(page=1, page_size=10)
+
+    response = paginate_response(resources, filters)
+
+    assert response["resources"] == [{"itemId": str(item_id)}]
@@ -12,6 +12,7 @@ from waldur_cscs_hpc_storage.models.enums import (
 )
 from waldur_cscs_hpc_storage.models import (
     ParsedWaldurResource,
+    Quota,
     ResourceLimits,
     ResourceOptions,
 )
@@ -83,6 +84,13 @@ class TestQuotaCalculator:
         assert inode_hard.quota == 10000.0
         assert inode_soft.unit == QuotaUnit.NONE
 
+    def test_calculate_quotas_are_valid_models(self, quota_calculator, mock_resource):
+        """Test that unvalidated quota construction matches validated models."""
+        quotas = quota_calculator.calculate_quotas(mock_resource)
+
+        for quota in quotas:
+            assert Quota.model_validate(quota.model_dump()) == quota
+
     def test_calculate_quotas_with_options_override(
         self, quota_calculator, mock_resource
     ):
@@ -121,6 +129,32 @@ class TestQuotaCalculator:
         assert inode_soft.quota == 500.0
         assert inode_hard.quota == 1500.0
 
+    def test_calculate_quotas_with_partial_inode_override(
+        self, quota_calculator, mock_resource
+    ):
+        """Test that only the inode quota without an override is derived."""
+        mock_resource.options = ResourceOptions(soft_quota_inodes=500)
+
+        quotas = quota_calculator.calculate_quotas(mock_resource)
+
+        assert quotas[2].quota == 500.0  # From options override
+        assert quotas[3].quota == 10000.0  # 10 TB * 1000 * 1.0
+
+    def test_calculate_quotas_reuses_results(self, quota_calculator, mock_resource):
+        """Test that equal limits and options reuse the computed quotas."""
+        first = quota_calculator.calculate_quotas(mock_resource)
+        second = quota_calculator.calculate_quotas(
+            mock_resource, override_limits=ResourceLimits(storage=10.0)
+        )
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+        other = quota_calculator.calculate_quotas(
+            mock_resource, override_limits=ResourceLimits(storage=20.0)
+        )
+        assert other[0].quota == 20.0
+
     def test_calculate_quotas_zero_storage(self, quota_calculator, mock_resource):
         """Test behavior when storage limit is 0."""
         mock_resource.limits = ResourceLimits(storage=0.0)
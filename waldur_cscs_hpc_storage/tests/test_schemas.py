@@ -1,11 +1,21 @@
 from unittest.mock import Mock
 
+import pytest
+from pydantic import ValidationError
+
 from waldur_api_client.models.order_details import OrderDetails
 from waldur_api_client.models.order_state import OrderState
 from waldur_api_client.models.resource import Resource
 from waldur_api_client.models.resource_state import ResourceState
 
-from waldur_cscs_hpc_storage.models import ParsedWaldurResource
+from waldur_cscs_hpc_storage.models import (
+    ParsedWaldurResource,
+    ResourceAttributes,
+    ResourceLimits,
+    ResourceOptions,
+)
+from waldur_cscs_hpc_storage.models.enums import StorageDataType
+from waldur_cscs_hpc_storage.models.schemas import loose_int
 from waldur_cscs_hpc_storage.tests.conftest import make_test_uuid
 
 
@@ -218,3 +228,83 @@ class TestResourceStateParsing:
         resource = self._get_resource(ResourceState.UPDATING)
         parsed = ParsedWaldurResource.from_waldur_resource(resource)
         assert parsed.state == ResourceState.UPDATING
+
+
+class TestTrustedConstruction:
+    def test_limits_fast_path_matches_validation(self):
+        for data in ({"storage": 5}, {"storage": 2.5, "cpu": 1}, {}, {"storage": None}):
+            assert ResourceLimits.from_trusted_dict(data) == ResourceLimits(**data)
+
+    def test_limits_invalid_storage_still_rejected(self):
+        with pytest.raises(ValidationError):
+            ResourceLimits.from_trusted_dict({"storage": -1})
+
+    def test_attributes_fast_path_matches_validation(self):
+        data = {"storage_data_type": "users", "permissions": "2770", "extra": 1}
+        assert ResourceAttributes.from_trusted_dict(data) == ResourceAttributes(**data)
+
+    def test_attributes_unknown_data_type_defaults_to_store(self):
+        attributes = ResourceAttributes.from_trusted_dict(
+            {"storage_data_type": "unknown"}
+        )
+        assert attributes.storage_data_type == StorageDataType.STORE
+        assert attributes.permissions == "775"
+
+    def test_attributes_invalid_permissions_still_rejected(self):
+        with pytest.raises(ValidationError):
+            ResourceAttributes.from_trusted_dict({"permissions": "999"})
+
+    def test_options_fast_path_matches_validation(self):
+        data = {"permissions": "770"}
+        assert ResourceOptions.from_trusted_dict(data) == ResourceOptions(**data)
+
+    def test_options_with_quotas_are_validated(self):
+        options = ResourceOptions.from_trusted_dict({"soft_quota_inodes": "100.0"})
+        assert options.soft_quota_inodes == 100
+
+    def test_options_invalid_permissions_still_rejected(self):
+        with pytest.raises(ValidationError):
+            ResourceOptions.from_trusted_dict({"permissions": "77a"})
+
+    def test_from_waldur_resource_parses_options(self):
+        resource = Resource.from_dict(
+            {
+                "uuid": make_test_uuid("123").hex,
+                "offering_uuid": make_test_uuid("456").hex,
+                "project_uuid": make_test_uuid("789").hex,
+                "customer_uuid": make_test_uuid("abc").hex,
+                "name": "Test Resource",
+                "slug": "test-resource",
+                "state": "OK",
+                "offering_name": "Test Offering",
+                "offering_slug": "test-offering",
+                "project_name": "Test Project",
+                "project_slug": "test-project",
+                "customer_name": "Test Customer",
+                "customer_slug": "test-customer",
+                "order_in_progress": None,
+                "options": {"permissions": "770", "hard_quota_inodes": "2000.0"},
+                "attributes": {"storage_data_type": "scratch"},
+            }
+        )
+
+        parsed = ParsedWaldurResource.from_waldur_resource(resource)
+
+        assert parsed.options.permissions == "770"
+        assert parsed.options.hard_quota_inodes == 2000
+        assert parsed.attributes.storage_data_type == StorageDataType.SCRATCH
+
+
+class TestLooseInt:
+    def test_passes_through_none_and_int(self):
+        assert loose_int(None) is None
+        assert loose_int(1500) == 1500
+
+    def test_converts_floats_and_numeric_strings(self):
+        assert loose_int(1500.9) == 1500
+        assert loose_int("10000.0") == 10000
+        assert type(loose_int(True)) is int
+
+    def test_rejects_non_numeric_values(self):
+        with pytest.raises(ValueError, match="Invalid integer value"):
+            loose_int("many")
@@ -50,6 +50,13 @@ def test_dump_json_list_with_uuid():
     assert loaded_data == [u1.hex, u2.hex]
 
 
+def test_dump_json_with_kwargs():
+    u = uuid.uuid4()
+    data = {"id": u}
+    json_str = dump_json(data, indent=2)
+    assert json_str == json.dumps({"id": u.hex}, indent=2)
+
+
 def test_json_response_with_uuid():
     u = uuid.uuid4()
     data = {"id": u}
@@ -3,8 +3,10 @@
 from waldur_api_client.models.resource_state import ResourceState
 
 from waldur_cscs_hpc_storage.mapper.state_mappers import (
+    get_target_status_from_waldur_state,
     get_waldur_state_from_target_status,
     REVERSE_STATUS_MAPPING,
+    TARGET_STATUS_MAPPING,
 )
 from waldur_cscs_hpc_storage.models.enums import TargetStatus
 
@@ -56,3 +58,16 @@ class TestReverseStatusMapping:
             get_waldur_state_from_target_status(TargetStatus.UPDATING)
             == ResourceState.UPDATING
         )
+
+
+class TestTargetStatusMapping:
+    """Test mapping from Waldur ResourceState to TargetStatus."""
+
+    def test_enum_and_string_states_map_identically(self):
+        """Both ResourceState members and raw state strings resolve the same."""
+        for state, expected in TARGET_STATUS_MAPPING.items():
+            assert get_target_status_from_waldur_state(state) == expected
+            assert get_target_status_from_waldur_state(state.value) == expected
+
+    def test_unknown_state_defaults_to_pending(self):
+        assert get_target_status_from_waldur_state("Unknown") == TargetStatus.PENDING
@@ -0,0 +1,42 @@
+"""Tests for the shared storage item factories."""
+
+import pytest
+from pydantic import ValidationError
+
+from waldur_cscs_hpc_storage.mapper import (
+    build_storage_data_type_item,
+    build_storage_file_system_item,
+    build_storage_system_item,
+    generate_storage_data_type_target_id,
+    generate_storage_filesystem_target_id,
+    generate_storage_system_target_id,
+)
+
+
+class TestStorageItems:
+    def test_storage_items_are_shared(self):
+        """Test that storage items are built once per system and data type."""
+        system_item = build_storage_system_item("capstor")
+        assert build_storage_system_item("capstor") is system_item
+        assert system_item.itemId == generate_storage_system_target_id("capstor")
+        assert system_item.key == "capstor"
+        assert system_item.name == "CAPSTOR"
+
+        file_system_item = build_storage_file_system_item("lustre")
+        assert build_storage_file_system_item("lustre") is file_system_item
+        assert file_system_item.itemId == generate_storage_filesystem_target_id(
+            "lustre"
+        )
+        assert file_system_item.key == "lustre"
+        assert file_system_item.name == "LUSTRE"
+
+        data_type_item = build_storage_data_type_item("store")
+        assert build_storage_data_type_item("store") is data_type_item
+        assert data_type_item.itemId == generate_storage_data_type_target_id("store")
+        assert data_type_item.key == "store"
+        assert data_type_item.name == "STORE"
+        assert data_type_item.path == "store"
+
+        # Shared instances must not be mutable through any single resource
+        with pytest.raises(ValidationError):
+            system_item.key = "other"
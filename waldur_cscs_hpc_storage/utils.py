@@ -28,12 +28,15 @@ def paginate_response(
 
     Returns:
         Dict containing the formatted response with 'status', 'resources', 'pagination', and 'filters_applied'.
+        All values are JSON-compatible primitives.
     """
     page = getattr(filters, "page", 1)
     page_size = getattr(filters, "page_size", 100)
 
     total_items = total_count if total_count is not None else len(resources)
-    total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 0
+    total_pages, remainder = divmod(total_items, page_size)
+    if remainder:
+        total_pages += 1
     has_next = page < total_pages
 
     # Slice to the requested page
@@ -41,9 +44,13 @@ def paginate_response(
     end = start + page_size
     page_resources = resources[start:end]
 
-    serialized_resources = [r.model_dump(by_alias=True) for r in page_resources]
+    # Dump straight to JSON-compatible primitives so the response can be
+    # rendered without another encoding pass over the resource tree.
+    serialized_resources = [
+        r.model_dump(mode="json", by_alias=True) for r in page_resources
+    ]
 
-    filters_applied = filters.model_dump(exclude_none=True)
+    filters_applied = filters.model_dump(mode="json", exclude_none=True)
     if extra_filters:
         filters_applied.update(extra_filters)
 